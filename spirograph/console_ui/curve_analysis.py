@@ -1,4 +1,3 @@
-import math
 from dataclasses import dataclass
 
 from spirograph.generation import SpiroType
@@ -19,16 +18,13 @@ class RepeatMetrics:
 
 
 def compute_curve_repeat_metrics(request: CircularSpiroRequest) -> RepeatMetrics:
-    fixed_int = max(1, int(request.fixed_radius))
-    rolling_int = max(1, int(request.rolling_radius))
-    gcd_value = max(1, math.gcd(fixed_int, rolling_int))
-    laps_to_close = max(1, rolling_int // gcd_value)
-
-    if request.curve_type is SpiroType.HYPOTROCHOID:
-        spin_numerator = abs(fixed_int - rolling_int)
+    if request.fixed_radius < 1 or request.rolling_radius < 1:
+        # Sub-unit radii truncate to 0 under integer gcd semantics, so there is no closure count to report.
+        gcd_value = laps_to_close = spins_to_close = 1
     else:
-        spin_numerator = fixed_int + rolling_int
-    spins_to_close = max(1, spin_numerator // gcd_value)
+        gcd_value = max(1, request.gcd_value)
+        laps_to_close = max(1, request.laps_to_close)
+        spins_to_close = max(1, request.spins_to_close)
 
     ratio = request.fixed_radius / request.rolling_radius if request.rolling_radius else 0.0
     offset_factor = request.pen_distance / request.rolling_radius if request.rolling_radius else 0.0
@@ -200,14 +196,12 @@ def describe_curve(request: CircularSpiroRequest) -> None:
     estimated_inner_radius = estimate_curve_inner_radius(request)
     density_notes = _build_density_notes(metrics, density_label)
 
-    print('\nCurve analysis:')
     print(
+        '\nCurve analysis:\n'
         f'  Closure: laps~{metrics.laps_to_close} '
-        f'spins~{metrics.spins_to_close} ({closure_structure})'
-    )
-    print(f'  Perceived symmetry while rendering: {symmetry_feel}')
-    print(
+        f'spins~{metrics.spins_to_close} ({closure_structure})\n'
+        f'  Perceived symmetry while rendering: {symmetry_feel}\n'
         f'  Visual density: {density_label} '
-        f'(footprint~{round(estimated_extent_radius)}, inner~{round(estimated_inner_radius)})'
+        f'(footprint~{round(estimated_extent_radius)}, inner~{round(estimated_inner_radius)})\n'
+        f'  Notes: {density_notes}\n'
     )
-    print(f'  Notes: {density_notes}\n')
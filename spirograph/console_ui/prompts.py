@@ -2,10 +2,14 @@ from typing import Callable
 
 import math
 
-from spirograph.generation import SpiroType
+from spirograph.generation import SpiroType, symmetric_arc_count
 from spirograph.rendering import Color, ColorMode
 from .types import RandomConstraintMode, RandomEvolutionMode
 
+MIN_STEPS = 1500
+MAX_STEPS = 20000
+STEP_SPACING_PIXELS = 1.5
+
 
 def make_prompt_label(identifier: str) -> str:
     return ' '.join(word.capitalize() for word in identifier.split('_'))
@@ -67,14 +71,12 @@ def prompt_enum(label: str, enum_cls, default):
 
 def prompt_positive_int(identifier: str, default_value: int | None = None) -> int:
     label = make_prompt_label(identifier)
+    prompt = f'{label} [{default_value}]: ' if default_value is not None else f'{label}: '
 
     while True:
-        if default_value is not None:
-            raw_value = input(f'{label} [{default_value}]: ').strip()
-            if raw_value == '':
-                return default_value
-        else:
-            raw_value = input(f'{label}: ').strip()
+        raw_value = input(prompt).strip()
+        if raw_value == '' and default_value is not None:
+            return default_value
 
         try:
             parsed_value = int(raw_value)
@@ -91,9 +93,10 @@ def prompt_positive_int(identifier: str, default_value: int | None = None) -> in
 
 def prompt_non_negative_float(identifier: str, default_value: float) -> float:
     label = make_prompt_label(identifier)
+    prompt = f'{label} [{default_value}]: '
 
     while True:
-        raw_value = input(f'{label} [{default_value}]: ').strip()
+        raw_value = input(prompt).strip()
         if raw_value == '':
             return default_value
 
@@ -112,9 +115,10 @@ def prompt_non_negative_float(identifier: str, default_value: float) -> float:
 
 def prompt_positive_float(identifier: str, default_value: float) -> float:
     label = make_prompt_label(identifier)
+    prompt = f'{label} [{default_value}]: '
 
     while True:
-        raw_value = input(f'{label} [{default_value}]: ').strip()
+        raw_value = input(prompt).strip()
         if raw_value == '':
             return default_value
 
@@ -137,9 +141,10 @@ def prompt_positive_int_or_random(
     random_factory: Callable[[], int],
 ) -> int:
     label = make_prompt_label(identifier)
+    suffix = f' [{default_value}]' if default_value is not None else ''
+    prompt = f"{label}{suffix} (or 'r'/'rand'/'random'): "
     while True:
-        suffix = f' [{default_value}]' if default_value is not None else ''
-        raw_value = input(f"{label}{suffix} (or 'r'/'rand'/'random'): ").strip()
+        raw_value = input(prompt).strip()
 
         if raw_value.lower() in ('r', 'rand'):
             value = random_factory()
@@ -164,9 +169,10 @@ def prompt_positive_int_or_random(
 
 def prompt_drawing_speed(current_speed: int) -> int:
     label = 'Drawing speed [1 (slow) - 10 (fast)]'
+    prompt = f'{label} [{current_speed}]: '
 
     while True:
-        raw_value = input(f'{label} [{current_speed}]: ').strip()
+        raw_value = input(prompt).strip()
         if raw_value == '':
             return current_speed
 
@@ -186,9 +192,10 @@ def prompt_drawing_speed(current_speed: int) -> int:
 def prompt_lock_value(identifier: str, current_value: int | None) -> int | None:
     label = make_prompt_label(identifier)
     current_display = 'r' if current_value is None else str(current_value)
+    prompt = f"{label} lock [{current_display}] (number or 'r'/'rand'/'random'): "
 
     while True:
-        raw_value = input(f"{label} lock [{current_display}] (number or 'r'/'rand'/'random'): ").strip().lower()
+        raw_value = input(prompt).strip().lower()
         if raw_value == '':
             return current_value
         if raw_value in ('r', 'rand', 'random'):
@@ -259,10 +266,35 @@ def parse_color(value: str, default: Color) -> Color:
     return color
 
 
-def compute_steps(fixed_radius: int, rolling_radius: int) -> int:
+def estimate_arc_length(
+    fixed_radius: int,
+    rolling_radius: int,
+    pen_distance: int,
+    curve_type: SpiroType,
+    laps: int,
+) -> float:
+    if curve_type is SpiroType.HYPOTROCHOID:
+        center_radius = abs(fixed_radius - rolling_radius)
+    else:
+        center_radius = fixed_radius + rolling_radius
+    # Upper bound on pen speed: the roller center moves at center_radius and the
+    # pen circles it at pen_distance * center_radius / rolling_radius.
+    pen_speed = center_radius + pen_distance * center_radius / rolling_radius
+    return math.tau * laps * pen_speed
+
+
+def compute_steps(fixed_radius: int, rolling_radius: int, pen_distance: int, curve_type: SpiroType) -> int:
     gcd_value = math.gcd(fixed_radius, rolling_radius)
     laps = rolling_radius // gcd_value if gcd_value else 1
-    return min(20000, max(3000, laps * 300))
+    arc_length = estimate_arc_length(fixed_radius, rolling_radius, pen_distance, curve_type, laps)
+    steps = min(MAX_STEPS, max(MIN_STEPS, int(arc_length / STEP_SPACING_PIXELS)))
+
+    # The generator only computes a single arc when the step count splits evenly between them.
+    arc_count = symmetric_arc_count(fixed_radius, rolling_radius, gcd_value)
+    aligned_steps = -(-steps // arc_count) * arc_count
+    if aligned_steps > MAX_STEPS:
+        aligned_steps -= arc_count
+    return aligned_steps if aligned_steps >= MIN_STEPS else steps
 
 
 def toggle_curve_type(current: SpiroType) -> SpiroType:
@@ -5,6 +5,17 @@ import math
 from spirograph.generation.requests import CircularSpiroRequest
 from .types import RandomConstraintMode, RandomEvolutionMode
 
+MAX_LAPS_TO_CLOSE = 200
+ROLLING_RADIUS_FACTORS = {
+    RandomConstraintMode.EXTENDED: 2.0,
+    RandomConstraintMode.WILD: 3.0,
+}
+PEN_OFFSET_FACTORS = {
+    RandomConstraintMode.PHYSICAL: 1.0,
+    RandomConstraintMode.EXTENDED: 1.6,
+    RandomConstraintMode.WILD: 1.6 * 1.5,
+}
+
 
 def evolve_value(
     previous: int | None,
@@ -42,17 +53,12 @@ def random_rolling_circle_radius(
 
     if constraint is RandomConstraintMode.PHYSICAL:
         max_r = fixed_radius - 1
-    elif constraint is RandomConstraintMode.EXTENDED:
-        max_r = int(fixed_radius * 2.0)
     else:
-        max_r = int(fixed_radius * 3.0)
+        max_r = int(fixed_radius * ROLLING_RADIUS_FACTORS[constraint])
 
     base_min = 2
     base_max = max_r
 
-    def laps_to_close_for(candidate_r: int) -> int:
-        return candidate_r // math.gcd(fixed_radius, candidate_r)
-
     best_r: int | None = None
     best_laps: int | None = None
 
@@ -60,13 +66,17 @@ def random_rolling_circle_radius(
         candidate_r = evolve_value(prev_r, base_min, base_max, evolution)
         candidate_r = max(2, candidate_r)
 
-        laps = laps_to_close_for(candidate_r)
+        # laps = r // gcd(R, r) never exceeds r, so small candidates need no gcd.
+        if candidate_r <= MAX_LAPS_TO_CLOSE:
+            return candidate_r
+
+        laps = candidate_r // math.gcd(fixed_radius, candidate_r)
 
         if best_laps is None or laps < best_laps:
             best_r = candidate_r
             best_laps = laps
 
-        if laps <= 200:
+        if laps <= MAX_LAPS_TO_CLOSE:
             return candidate_r
 
     if best_r is None:
@@ -84,11 +94,6 @@ def random_pen_offset(
     prev_d = int(prev.pen_distance) if prev else None
 
     base_min = 1
-    if constraint is RandomConstraintMode.PHYSICAL:
-        base_max = max(1, int(rolling_radius))
-    elif constraint is RandomConstraintMode.EXTENDED:
-        base_max = int(rolling_radius * 1.6)
-    else:
-        base_max = int(rolling_radius * 1.6 * 1.5)
+    base_max = max(1, int(rolling_radius * PEN_OFFSET_FACTORS[constraint]))
 
     return evolve_value(prev_d, base_min, base_max, evolution)
@@ -24,3 +24,9 @@ class ConsoleUiSessionState:
     locked_pen_distance: int | None = None
 
     last_request: CircularSpiroRequest | None = None
+
+    def __post_init__(self) -> None:
+        if self.laps_per_color < 1:
+            raise ValueError('laps_per_color must be >= 1')
+        if self.spins_per_color < 1:
+            raise ValueError('spins_per_color must be >= 1')
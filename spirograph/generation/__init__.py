@@ -1,11 +1,10 @@
-from .circular_generator import CircularSpiroGenerator
+from .circular_generator import CircularSpiroGenerator, symmetric_arc_count
 from .generator import CurveGenerator
 from .registry import GeneratorRegistry
 from .requests import CircularSpiroRequest, EngineRequest
-from .types import GeneratedCurve, Point2D, PointSpan, SpanKind, SpiroType
+from .types import GeneratedCurve, PointSpan, SpanKind, SpiroType
 
 __all__ = [
-    'Point2D',
     'SpanKind',
     'PointSpan',
     'GeneratedCurve',
@@ -15,4 +14,5 @@ __all__ = [
     'CurveGenerator',
     'CircularSpiroGenerator',
     'GeneratorRegistry',
+    'symmetric_arc_count',
 ]
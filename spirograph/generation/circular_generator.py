@@ -1,13 +1,34 @@
+import functools
+import itertools
 import math
+from array import array
+from collections.abc import Iterable, Iterator
+from types import MappingProxyType
 
 from .generator import CurveGenerator
 from .requests import CircularSpiroRequest
-from .types import GeneratedCurve, Point2D, PointSpan, SpanKind, SpiroType
+from .types import GeneratedCurve, PointSpan, SpanKind, SpiroType
+
+RESEED_INTERVAL = 1024
+CURVE_CACHE_SIZE = 16
+
+
+def symmetric_arc_count(fixed_radius: float, rolling_radius: float, gcd_value: int) -> int:
+    # With integer radii the closed curve is made of fixed_radius / gcd identical arcs,
+    # each rotated from the previous one.
+    if not gcd_value:
+        return 1
+    if not (float(fixed_radius).is_integer() and float(rolling_radius).is_integer()):
+        return 1
+    return int(fixed_radius) // gcd_value
 
 
 class CircularSpiroGenerator(CurveGenerator[CircularSpiroRequest]):
     request_type = CircularSpiroRequest
 
+    def __init__(self) -> None:
+        self._generate_cached = functools.lru_cache(maxsize=CURVE_CACHE_SIZE)(self._generate)
+
     def validate(self, request: CircularSpiroRequest) -> None:
         if request.fixed_radius <= 0:
             raise ValueError('fixed_radius must be > 0')
@@ -20,24 +41,109 @@ class CircularSpiroGenerator(CurveGenerator[CircularSpiroRequest]):
 
     def generate(self, request: CircularSpiroRequest) -> GeneratedCurve:
         self.validate(request)
+        return self._generate_cached(request)
+
+    def _generate(self, request: CircularSpiroRequest) -> GeneratedCurve:
+        symmetry_order = self._symmetry_order(request)
+        if symmetry_order > 1:
+            xs, ys = self._generate_by_symmetry(request, symmetry_order)
+        else:
+            xs, ys = self._collect_coordinates(self._iter_coordinates(request))
+        spans = self._build_spans(request)
+        # Cached curves are shared between callers, so points and metadata are read-only views.
+        return GeneratedCurve(
+            xs=memoryview(xs).toreadonly(),
+            ys=memoryview(ys).toreadonly(),
+            spans=spans,
+            metadata=MappingProxyType({'laps_to_close': request.laps_to_close}),
+        )
+
+    @staticmethod
+    def _collect_coordinates(coordinates: Iterable[tuple[float, float]]) -> tuple[array[float], array[float]]:
+        xs: array[float] = array('d')
+        ys: array[float] = array('d')
+        append_x = xs.append
+        append_y = ys.append
+        for x, y in coordinates:
+            append_x(x)
+            append_y(y)
+        return xs, ys
+
+    @staticmethod
+    def _symmetry_order(request: CircularSpiroRequest) -> int:
+        # Arcs are only reused when every arc gets a whole number of steps.
+        order = symmetric_arc_count(request.fixed_radius, request.rolling_radius, request.gcd_value)
+        if request.steps % order:
+            return 1
+        return order
+
+    def _generate_by_symmetry(self, request: CircularSpiroRequest, order: int) -> tuple[array[float], array[float]]:
+        arc_steps = request.steps // order
+        base_xs, base_ys = self._collect_coordinates(itertools.islice(self._iter_coordinates(request), arc_steps))
+        xs = array('d', base_xs)
+        ys = array('d', base_ys)
+        arc_angle = math.tau * request.laps_to_close / order
+        for arc in range(1, order):
+            c = math.cos(arc * arc_angle)
+            s = math.sin(arc * arc_angle)
+            xs.extend([c * x - s * y for x, y in zip(base_xs, base_ys)])
+            ys.extend([s * x + c * y for x, y in zip(base_xs, base_ys)])
+        xs.append(base_xs[0])
+        ys.append(base_ys[0])
+        return xs, ys
 
-        fixed_radius = request.fixed_radius
+    @staticmethod
+    def _iter_coordinates(request: CircularSpiroRequest) -> Iterator[tuple[float, float]]:
         rolling_radius = request.rolling_radius
         pen_distance = request.pen_distance
-        fixed_int = int(fixed_radius)
-        rolling_int = int(rolling_radius)
-        gcd_value = math.gcd(fixed_int, rolling_int)
-        laps_to_close = rolling_int // gcd_value
-        period = 2.0 * math.pi * laps_to_close
+        steps = request.steps
+        period = math.tau * request.laps_to_close
 
         if request.curve_type is SpiroType.HYPOTROCHOID:
-            ratio = (fixed_radius - rolling_radius) / rolling_radius
-            spin_ratio = ratio
+            center_radius = request.fixed_radius - rolling_radius
+            pen_x = pen_distance
         else:
-            ratio = (fixed_radius + rolling_radius) / rolling_radius
-            spin_ratio = ratio
+            center_radius = request.fixed_radius + rolling_radius
+            pen_x = -pen_distance
+        ratio = center_radius / rolling_radius
+
+        cos = math.cos
+        sin = math.sin
+        step_angle = period / steps
+        cos_step = cos(step_angle)
+        sin_step = sin(step_angle)
+        spin_cos_step = cos(ratio * step_angle)
+        spin_sin_step = sin(ratio * step_angle)
+        reseed_mask = RESEED_INTERVAL - 1
+
+        # Both angles advance by a constant per step, so each (cos, sin) pair is
+        # rotated forward instead of re-evaluated. Reseeding from the exact angle
+        # every RESEED_INTERVAL steps keeps the accumulated rounding drift ~1e-11.
+        for step in range(steps + 1):
+            if not step & reseed_mask:
+                t = (step / steps) * period
+                c = cos(t)
+                s = sin(t)
+                spin_c = cos(ratio * t)
+                spin_s = sin(ratio * t)
+            yield center_radius * c + pen_x * spin_c, center_radius * s - pen_distance * spin_s
+            c, s = c * cos_step - s * sin_step, s * cos_step + c * sin_step
+            spin_c, spin_s = (
+                spin_c * spin_cos_step - spin_s * spin_sin_step,
+                spin_s * spin_cos_step + spin_c * spin_sin_step,
+            )
+
+    @staticmethod
+    def _build_spans(request: CircularSpiroRequest) -> tuple[PointSpan, ...]:
+        laps_to_close = request.laps_to_close
+        steps = request.steps
+        period = math.tau * laps_to_close
+
+        if request.curve_type is SpiroType.HYPOTROCHOID:
+            spin_ratio = (request.fixed_radius - request.rolling_radius) / request.rolling_radius
+        else:
+            spin_ratio = (request.fixed_radius + request.rolling_radius) / request.rolling_radius
 
-        points: list[Point2D] = []
         lap_spans: list[PointSpan] = []
         spin_spans: list[PointSpan] = []
 
@@ -46,21 +152,11 @@ class CircularSpiroGenerator(CurveGenerator[CircularSpiroRequest]):
         lap_start = 0
         spin_start = 0
 
-        for step in range(request.steps + 1):
-            t = (step / request.steps) * period
-            if request.curve_type is SpiroType.HYPOTROCHOID:
-                diff = fixed_radius - rolling_radius
-                x = diff * math.cos(t) + pen_distance * math.cos(ratio * t)
-                y = diff * math.sin(t) - pen_distance * math.sin(ratio * t)
-            else:
-                summ = fixed_radius + rolling_radius
-                x = summ * math.cos(t) - pen_distance * math.cos(ratio * t)
-                y = summ * math.sin(t) - pen_distance * math.sin(ratio * t)
-            points.append(Point2D(x=x, y=y))
-
-            lap_index = (step * laps_to_close) // request.steps
-            spin_progress = abs(spin_ratio * t) / (2.0 * math.pi) if spin_ratio else 0.0
-            spin_index = int(spin_progress)
+        for step in range(steps + 1):
+            t = (step / steps) * period
+
+            lap_index = (step * laps_to_close) // steps
+            spin_index = int(abs(spin_ratio * t) / math.tau)
 
             if lap_index > current_lap:
                 lap_spans.append(
@@ -86,7 +182,7 @@ class CircularSpiroGenerator(CurveGenerator[CircularSpiroRequest]):
                 spin_start = step + 1
                 current_spin = spin_index
 
-        final_index = len(points)
+        final_index = steps + 1
         if lap_start < final_index:
             lap_spans.append(
                 PointSpan(
@@ -105,8 +201,4 @@ class CircularSpiroGenerator(CurveGenerator[CircularSpiroRequest]):
                     ordinal=current_spin,
                 )
             )
-        return GeneratedCurve(
-            points=tuple(points),
-            spans=tuple(lap_spans + spin_spans),
-            metadata={'laps_to_close': laps_to_close},
-        )
+        return tuple(lap_spans + spin_spans)
@@ -1,4 +1,5 @@
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, field
 from typing import Protocol
 
 from .types import SpiroType
@@ -15,6 +16,9 @@ class CircularSpiroRequest:
     pen_distance: float
     steps: int
     curve_type: SpiroType = SpiroType.HYPOTROCHOID
+    gcd_value: int = field(init=False, repr=False, compare=False)
+    laps_to_close: int = field(init=False, repr=False, compare=False)
+    spins_to_close: int = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         if self.fixed_radius <= 0:
@@ -25,3 +29,14 @@ class CircularSpiroRequest:
             raise ValueError('pen_distance must be >= 0')
         if self.steps <= 0:
             raise ValueError('steps must be > 0')
+
+        fixed_int = int(self.fixed_radius)
+        rolling_int = int(self.rolling_radius)
+        gcd_value = math.gcd(fixed_int, rolling_int)
+        if self.curve_type is SpiroType.HYPOTROCHOID:
+            spin_numerator = abs(fixed_int - rolling_int)
+        else:
+            spin_numerator = fixed_int + rolling_int
+        object.__setattr__(self, 'gcd_value', gcd_value)
+        object.__setattr__(self, 'laps_to_close', rolling_int // gcd_value if gcd_value else 0)
+        object.__setattr__(self, 'spins_to_close', spin_numerator // gcd_value if gcd_value else 0)
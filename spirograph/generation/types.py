@@ -1,15 +1,10 @@
 from __future__ import annotations
 
+from collections.abc import Mapping, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
 
 
-@dataclass(frozen=True, slots=True)
-class Point2D:
-    x: float
-    y: float
-
-
 class SpanKind(Enum):
     LAP = 'LAP'
     SPIN = 'SPIN'
@@ -33,18 +28,25 @@ class PointSpan:
 
 @dataclass(frozen=True, slots=True)
 class GeneratedCurve:
-    points: tuple[Point2D, ...]
+    xs: Sequence[float]
+    ys: Sequence[float]
     spans: tuple[PointSpan, ...]
-    metadata: dict[str, object] = field(default_factory=dict)
+    metadata: Mapping[str, object] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
-        if len(self.points) <= 1:
+        if len(self.xs) != len(self.ys):
+            raise ValueError('xs and ys must have the same length')
+        if len(self.xs) <= 1:
             raise ValueError('points must contain at least 2 entries')
-        max_index = len(self.points)
+        max_index = len(self.xs)
         for span in self.spans:
             if span.start_index < 0 or span.end_index > max_index:
                 raise ValueError('span indices must be within points bounds')
 
+    @property
+    def point_count(self) -> int:
+        return len(self.xs)
+
 
 class SpiroType(Enum):
     HYPOTROCHOID = 'hypotrochoid'
@@ -1,8 +1,9 @@
+import functools
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 
-import math
-
-from spirograph.generation import SpiroType
+from spirograph.generation import GeneratedCurve, SpiroType
 from .console_ui.curve_analysis import describe_curve
 from .console_ui.input_guidance import (
     guide_before_fixed_radius,
@@ -23,6 +24,7 @@ from .console_ui.prompts import (
     try_parse_color,
 )
 from .console_ui.random import (
+    MAX_LAPS_TO_CLOSE,
     random_fixed_circle_radius,
     random_pen_offset,
     random_rolling_circle_radius,
@@ -40,8 +42,6 @@ from .rendering import (
     ColorMode,
 )
 
-MAX_LAPS_TO_CLOSE = 200
-
 MENU_TEXT = """
 Next action:
 Geometry:
@@ -62,15 +62,11 @@ Program:
 """
 
 
-def compute_laps_to_close(fixed_radius: int, rolling_radius: int) -> int:
-    gcd_value = math.gcd(fixed_radius, rolling_radius)
-    return max(1, rolling_radius // gcd_value) if gcd_value else 1
-
-
 def prompt_color_value(current_color: Color) -> Color:
     label = make_prompt_label('color')
+    prompt = f'{label} [{current_color.as_hex}]: '
     while True:
-        raw_value = input(f'{label} [{current_color.as_hex}]: ').strip()
+        raw_value = input(prompt).strip()
         if raw_value == '':
             return current_color
 
@@ -119,7 +115,7 @@ Drawing:
 """)
 
 
-def print_menu(session: ConsoleUiSessionState) -> None:
+def print_menu() -> None:
     print(MENU_TEXT)
 
 
@@ -131,9 +127,9 @@ def format_color_summary(session: ConsoleUiSessionState) -> str:
     if session.color_mode is ColorMode.FIXED:
         return f'{session.color_mode.value}({session.color.as_hex})'
     if session.color_mode is ColorMode.RANDOM_EVERY_N_LAPS:
-        return f'{session.color_mode.value}(n={max(1, session.laps_per_color)})'
+        return f'{session.color_mode.value}(n={session.laps_per_color})'
     if session.color_mode is ColorMode.RANDOM_EVERY_N_SPINS:
-        return f'{session.color_mode.value}(n={max(1, session.spins_per_color)})'
+        return f'{session.color_mode.value}(n={session.spins_per_color})'
     return session.color_mode.value
 
 
@@ -155,20 +151,25 @@ def print_prompt_status(session: ConsoleUiSessionState) -> None:
 
 
 def build_session_menu_text(session: ConsoleUiSessionState) -> str:
+    return format_session_menu_text(session.color_mode)
+
+
+@functools.cache
+def format_session_menu_text(color_mode: ColorMode) -> str:
     color_disabled_suffix = (
         ''
-        if session.color_mode is ColorMode.FIXED
-        else f" [disabled: mode is '{session.color_mode.value}']"
+        if color_mode is ColorMode.FIXED
+        else f" [disabled: mode is '{color_mode.value}']"
     )
     laps_disabled_suffix = (
         ''
-        if session.color_mode is ColorMode.RANDOM_EVERY_N_LAPS
-        else f" [disabled: mode is '{session.color_mode.value}']"
+        if color_mode is ColorMode.RANDOM_EVERY_N_LAPS
+        else f" [disabled: mode is '{color_mode.value}']"
     )
     spins_disabled_suffix = (
         ''
-        if session.color_mode is ColorMode.RANDOM_EVERY_N_SPINS
-        else f" [disabled: mode is '{session.color_mode.value}']"
+        if color_mode is ColorMode.RANDOM_EVERY_N_SPINS
+        else f" [disabled: mode is '{color_mode.value}']"
     )
     return f"""
 Session settings:
@@ -192,7 +193,7 @@ def build_request(
     pen_distance: int,
     curve_type: SpiroType,
 ) -> CircularSpiroRequest:
-    steps = compute_steps(fixed_radius, rolling_radius)
+    steps = compute_steps(fixed_radius, rolling_radius, pen_distance, curve_type)
     return CircularSpiroRequest(
         fixed_radius=fixed_radius,
         rolling_radius=rolling_radius,
@@ -228,20 +229,22 @@ def generate_random_request(session: ConsoleUiSessionState) -> CircularSpiroRequ
     else:
         pen_distance = session.locked_pen_distance
 
+    request = build_request(
+        fixed_radius,
+        rolling_radius,
+        pen_distance,
+        session.curve_type,
+    )
+
     if session.locked_rolling_radius is not None:
-        laps = compute_laps_to_close(fixed_radius, rolling_radius)
+        laps = max(1, request.laps_to_close)
         if laps > MAX_LAPS_TO_CLOSE:
             print(
                 f'Warning: locked r produces {laps} laps (> {MAX_LAPS_TO_CLOSE}). '
                 'This may be slow. Consider unlocking r or choosing a different value.'
             )
 
-    return build_request(
-        fixed_radius,
-        rolling_radius,
-        pen_distance,
-        session.curve_type,
-    )
+    return request
 
 
 def edit_geometry(session: ConsoleUiSessionState) -> CircularSpiroRequest:
@@ -370,30 +373,15 @@ def edit_locks(session: ConsoleUiSessionState) -> None:
 
 def resolve_interval(session: ConsoleUiSessionState) -> int:
     if session.color_mode is ColorMode.RANDOM_EVERY_N_LAPS:
-        return max(1, session.laps_per_color)
+        return session.laps_per_color
     if session.color_mode is ColorMode.RANDOM_EVERY_N_SPINS:
-        return max(1, session.spins_per_color)
+        return session.spins_per_color
     return 1
 
 
-def compute_spins_to_close(request: CircularSpiroRequest) -> int:
-    fixed = int(request.fixed_radius)
-    rolling = int(request.rolling_radius)
-    gcd_value = math.gcd(fixed, rolling)
-    if gcd_value == 0:
-        return 1
-
-    if request.curve_type is SpiroType.HYPOTROCHOID:
-        spin_numerator = abs(fixed - rolling)
-    else:
-        spin_numerator = fixed + rolling
-
-    return max(1, spin_numerator // gcd_value)
-
-
 def print_render_preview(request: CircularSpiroRequest, session: ConsoleUiSessionState) -> None:
-    laps_to_close = compute_laps_to_close(int(request.fixed_radius), int(request.rolling_radius))
-    spins_to_close = compute_spins_to_close(request)
+    laps_to_close = max(1, request.laps_to_close)
+    spins_to_close = max(1, request.spins_to_close)
     interval = resolve_interval(session)
     print(
         '\nRender preview: '
@@ -418,6 +406,7 @@ def render_request(
     orchestrator: CurveOrchestrator,
     request: CircularSpiroRequest,
     session: ConsoleUiSessionState,
+    curve: GeneratedCurve | None = None,
 ) -> None:
     interval = resolve_interval(session)
     settings = RenderSettings(
@@ -427,11 +416,13 @@ def render_request(
         width=session.line_width,
         speed=session.drawing_speed,
     )
-    orchestrator.run(request, settings)
+    if curve is None:
+        orchestrator.run(request, settings)
+    else:
+        orchestrator.render(curve, settings)
 
 
-def run_request_flow(
-    orchestrator: CurveOrchestrator,
+def present_request(
     request: CircularSpiroRequest,
     session: ConsoleUiSessionState,
     *,
@@ -442,9 +433,56 @@ def run_request_flow(
     if include_analysis:
         describe_curve(request)
     print_render_preview(request, session)
+
+
+def run_request_flow(
+    orchestrator: CurveOrchestrator,
+    request: CircularSpiroRequest,
+    session: ConsoleUiSessionState,
+    *,
+    include_analysis: bool = True,
+) -> None:
+    present_request(request, session, include_analysis=include_analysis)
     render_request(orchestrator, request, session)
 
 
+def prepare_random_curve(
+    orchestrator: CurveOrchestrator,
+    session: ConsoleUiSessionState,
+) -> tuple[CircularSpiroRequest, GeneratedCurve]:
+    request = generate_random_request(session)
+    return request, orchestrator.generate(request)
+
+
+def run_batch(
+    orchestrator: CurveOrchestrator,
+    session: ConsoleUiSessionState,
+    count: int,
+    pause_seconds: float,
+) -> None:
+    completed_count = 0
+    # Turtle/Tk calls must stay on the main thread, so only the next random
+    # request and its geometry are prepared in the background while the
+    # current curve renders and the pause elapses. The worker gets its own
+    # session copy so it never reads state the main thread is updating.
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        try:
+            request, curve = prepare_random_curve(orchestrator, session)
+            for index in range(count):
+                present_request(request, session)
+                next_curve: Future[tuple[CircularSpiroRequest, GeneratedCurve]] | None = None
+                if index + 1 < count:
+                    next_curve = executor.submit(prepare_random_curve, orchestrator, replace(session))
+                render_request(orchestrator, request, session, curve)
+                completed_count += 1
+                time.sleep(pause_seconds)
+                if next_curve is not None:
+                    request, curve = next_curve.result()
+        except KeyboardInterrupt:
+            executor.shutdown(wait=False, cancel_futures=True)
+            print(f'\nBatch interrupted. Completed {completed_count}/{count} curve(s).')
+
+
 def main() -> None:
     registry = GeneratorRegistry()
     registry.register(CircularSpiroGenerator())
@@ -454,7 +492,7 @@ def main() -> None:
     orchestrator = CurveOrchestrator(registry, builder, renderer)
 
     session = ConsoleUiSessionState()
-    print_menu(session)
+    print_menu()
 
     while True:
         print_prompt_status(session)
@@ -465,7 +503,7 @@ def main() -> None:
                 break
 
             case 'h' | '?':
-                print_menu(session)
+                print_menu()
                 continue
 
             case 'a':
@@ -487,16 +525,7 @@ def main() -> None:
             case 'b':
                 count = prompt_positive_int('batch_count', default_value=10)
                 pause_seconds = prompt_non_negative_float('pause_seconds', default_value=2.0)
-                completed_count = 0
-                try:
-                    for _ in range(count):
-                        request = generate_random_request(session)
-                        run_request_flow(orchestrator, request, session)
-                        completed_count += 1
-                        time.sleep(pause_seconds)
-                except KeyboardInterrupt:
-                    print(f'\nBatch interrupted. Completed {completed_count}/{count} curve(s).')
-
+                run_batch(orchestrator, session, count, pause_seconds)
                 continue
 
             case 'l':
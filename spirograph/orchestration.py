@@ -1,5 +1,6 @@
 from spirograph.generation.registry import GeneratorRegistry
 from spirograph.generation.requests import EngineRequest
+from spirograph.generation.types import GeneratedCurve
 from spirograph.rendering import RenderSettings
 from spirograph.rendering.builder import RenderPlanBuilder
 from spirograph.rendering.types import CurveRenderer
@@ -17,7 +18,12 @@ class CurveOrchestrator:
         self._renderer = renderer
 
     def run(self, request: EngineRequest, settings: RenderSettings) -> None:
+        self.render(self.generate(request), settings)
+
+    def generate(self, request: EngineRequest) -> GeneratedCurve:
         generator = self._registry.for_request(request)
-        curve = generator.generate(request)
+        return generator.generate(request)
+
+    def render(self, curve: GeneratedCurve, settings: RenderSettings) -> None:
         plan = self._builder.build(curve, settings)
         self._renderer.render(plan, settings)
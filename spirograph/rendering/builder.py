@@ -20,7 +20,8 @@ class RenderPlanBuilder:
             return RenderPlan(
                 paths=(
                     DrawablePath(
-                        points=curve.points,
+                        xs=curve.xs,
+                        ys=curve.ys,
                         color=color,
                         width=settings.width,
                     ),
@@ -32,7 +33,8 @@ class RenderPlanBuilder:
             return RenderPlan(
                 paths=(
                     DrawablePath(
-                        points=curve.points,
+                        xs=curve.xs,
+                        ys=curve.ys,
                         color=color,
                         width=settings.width,
                     ),
@@ -54,7 +56,8 @@ class RenderPlanBuilder:
             return RenderPlan(
                 paths=(
                     DrawablePath(
-                        points=curve.points,
+                        xs=curve.xs,
+                        ys=curve.ys,
                         color=color,
                         width=settings.width,
                     ),
@@ -67,11 +70,12 @@ class RenderPlanBuilder:
             group_end_index = min(index + interval - 1, len(spans) - 1)
             start_index = spans[index].start_index
             end_index = spans[group_end_index].end_index
-            slice_end = min(end_index + 1, len(curve.points))
+            slice_end = min(end_index + 1, curve.point_count)
             if slice_end > start_index:
                 paths.append(
                     DrawablePath(
-                        points=curve.points[start_index:slice_end],
+                        xs=curve.xs[start_index:slice_end],
+                        ys=curve.ys[start_index:slice_end],
                         color=random_color(),
                         width=settings.width,
                     )
@@ -83,7 +87,8 @@ class RenderPlanBuilder:
             return RenderPlan(
                 paths=(
                     DrawablePath(
-                        points=curve.points,
+                        xs=curve.xs,
+                        ys=curve.ys,
                         color=color,
                         width=settings.width,
                     ),
@@ -1,8 +1,25 @@
+import time
 import turtle
+from collections.abc import Sequence
 
 from spirograph.viewport import Viewport
 
-from .types import CurveRenderer, RenderPlan, RenderSettings
+from .types import CurveRenderer, DrawablePath, RenderPlan, RenderSettings
+
+INSTANT_DRAW_SPEED = 10
+EVENT_PUMP_INTERVAL_SECONDS = 0.05
+
+
+def to_canvas_coords(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    xscale: float = 1.0,
+    yscale: float = 1.0,
+) -> list[float]:
+    coords = [0.0] * (2 * len(xs))
+    coords[0::2] = [x * xscale for x in xs]
+    coords[1::2] = [-y * yscale for y in ys]
+    return coords
 
 
 class TurtleGraphicsRenderer(CurveRenderer):
@@ -11,31 +28,56 @@ class TurtleGraphicsRenderer(CurveRenderer):
         self._screen.setup(width=int(Viewport.WIDTH), height=int(Viewport.HEIGHT))
         self._screen.colormode(255)
         self._screen.tracer(0, 0)
-        self._pen = turtle.Turtle()
-        self._pen.hideturtle()
-        self._pen.speed(0)
+        self._canvas = self._screen.getcanvas()
+        self._line_items: list[int] = []
+        self._last_event_pump = 0.0
 
     def render(self, plan: RenderPlan, settings: RenderSettings) -> None:
-        self._pen.clear()
+        for item in self._line_items:
+            self._canvas.delete(item)
+        self._line_items.clear()
 
-        batch = 2 ** max(0, settings.speed - 1)
-        if batch < 1:
-            batch = 1
+        instant = settings.speed >= INSTANT_DRAW_SPEED
+        batch = 1 << max(0, settings.speed - 1)
+        self._last_event_pump = time.monotonic()
 
         for path in plan.paths:
-            if not path.points:
+            if not path.xs:
                 continue
-            self._pen.penup()
-            start = path.points[0]
-            self._pen.goto(start.x, start.y)
-            self._pen.pendown()
-            self._pen.color(path.color.as_rgb)
-            self._pen.width(path.width)
-            index = 1
-            for point in path.points[1:]:
-                self._pen.goto(point.x, point.y)
-                if index % batch == 0:
-                    self._screen.update()
-                index += 1
-            self._screen.update()
+            self._draw_on_canvas(path, len(path.xs) if instant else batch)
+            if not instant:
+                self._refresh()
         self._screen.update()
+
+    def _refresh(self) -> None:
+        # Most refreshes only flush pending redraws; a full update every
+        # EVENT_PUMP_INTERVAL_SECONDS keeps the window movable, closable and repainted.
+        now = time.monotonic()
+        if now - self._last_event_pump >= EVENT_PUMP_INTERVAL_SECONDS:
+            self._last_event_pump = now
+            self._screen.update()
+        else:
+            self._canvas.update_idletasks()
+
+    def _draw_on_canvas(self, path: DrawablePath, batch: int) -> None:
+        # One polyline item per path, grown a batch of segments at a time, replaces a
+        # turtle goto (and a canvas line item) per point; turtle's coordinate mapping is kept.
+        coords = to_canvas_coords(path.xs, path.ys, self._screen.xscale, self._screen.yscale)
+        last_index = len(coords) // 2 - 1
+        if last_index < 1:
+            return
+        end = min(batch, last_index)
+        item = self._canvas.create_line(
+            coords[: 2 * end + 2],
+            fill=path.color.as_hex,
+            width=path.width,
+            capstyle='round',
+        )
+        self._line_items.append(item)
+        insert = self._canvas.insert
+        refresh = self._refresh
+        while end < last_index:
+            refresh()
+            start = end
+            end = min(start + batch, last_index)
+            insert(item, 'end', coords[2 * start + 2 : 2 * end + 2])
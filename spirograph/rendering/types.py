@@ -1,9 +1,8 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from enum import Enum
 
-from spirograph.generation.types import Point2D
-
 
 @dataclass(frozen=True, slots=True)
 class Color:
@@ -11,6 +10,10 @@ class Color:
     g: int
     b: int
     a: int = 255
+    _hex: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, '_hex', f'#{self.r:02x}{self.g:02x}{self.b:02x}')
 
     @property
     def as_rgb(self) -> tuple[int, int, int]:
@@ -18,12 +21,13 @@ class Color:
 
     @property
     def as_hex(self) -> str:
-        return f'#{self.r:02x}{self.g:02x}{self.b:02x}'
+        return self._hex
 
 
 @dataclass(frozen=True, slots=True)
 class DrawablePath:
-    points: tuple[Point2D, ...]
+    xs: Sequence[float]
+    ys: Sequence[float]
     color: Color
     width: float
 
@@ -72,6 +72,23 @@ def test_compute_curve_repeat_metrics_handles_small_float_radii_with_guards() ->
     assert metrics.offset_factor == pytest.approx(0.5)
 
 
+def test_compute_curve_repeat_metrics_reports_single_closure_for_sub_unit_fixed_radius() -> None:
+    request = CircularSpiroRequest(
+        fixed_radius=0.5,
+        rolling_radius=3,
+        pen_distance=1,
+        steps=120,
+        curve_type=SpiroType.EPITROCHOID,
+    )
+
+    metrics = compute_curve_repeat_metrics(request)
+
+    assert metrics.gcd_value == 1
+    assert metrics.laps_to_close == 1
+    assert metrics.spins_to_close == 1
+    assert metrics.ratio == pytest.approx(0.5 / 3)
+
+
 @pytest.mark.parametrize(
     ('score', 'expected_label'),
     (
@@ -1,4 +1,9 @@
-from spirograph.console_ui.prompts import try_parse_color
+import math
+
+import pytest
+
+from spirograph.console_ui.prompts import MAX_STEPS, MIN_STEPS, compute_steps, try_parse_color
+from spirograph.generation import SpiroType, symmetric_arc_count
 from spirograph.rendering import Color
 
 
@@ -27,3 +32,36 @@ def test_try_parse_color_reports_invalid_input() -> None:
     parsed, _color = try_parse_color('not-a-color')
 
     assert parsed is False
+
+
+def test_compute_steps_gives_simple_curves_fewer_steps_than_dense_curves() -> None:
+    simple_steps = compute_steps(200, 100, 50, SpiroType.HYPOTROCHOID)
+    dense_steps = compute_steps(200, 70, 50, SpiroType.HYPOTROCHOID)
+
+    assert MIN_STEPS <= simple_steps < dense_steps <= MAX_STEPS
+
+
+def test_compute_steps_clamps_to_bounds() -> None:
+    assert compute_steps(100, 50, 1, SpiroType.HYPOTROCHOID) == MIN_STEPS
+    assert compute_steps(250, 249, 400, SpiroType.EPITROCHOID) == MAX_STEPS
+
+
+@pytest.mark.parametrize(
+    ('fixed_radius', 'rolling_radius', 'pen_distance', 'curve_type'),
+    (
+        (200, 70, 50, SpiroType.HYPOTROCHOID),
+        (301, 299, 400, SpiroType.EPITROCHOID),
+        (137, 45, 60, SpiroType.HYPOTROCHOID),
+    ),
+)
+def test_compute_steps_splits_evenly_between_symmetric_arcs(
+    fixed_radius: int,
+    rolling_radius: int,
+    pen_distance: int,
+    curve_type: SpiroType,
+) -> None:
+    steps = compute_steps(fixed_radius, rolling_radius, pen_distance, curve_type)
+    arc_count = symmetric_arc_count(fixed_radius, rolling_radius, math.gcd(fixed_radius, rolling_radius))
+
+    assert MIN_STEPS <= steps <= MAX_STEPS
+    assert steps % arc_count == 0
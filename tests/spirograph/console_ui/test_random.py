@@ -67,3 +67,34 @@ def test_random_pen_offset_physical_mode_handles_small_rolling_radius(monkeypatc
     )
 
     assert result == 1
+
+
+def test_random_rolling_circle_radius_accepts_small_candidate_directly(monkeypatch: pytest.MonkeyPatch) -> None:
+    def fail_gcd(*_args: int) -> int:
+        raise AssertionError('gcd should not be needed for small candidates')
+
+    monkeypatch.setattr(random_helpers.random, 'randint', lambda _lower, _upper: random_helpers.MAX_LAPS_TO_CLOSE)
+    monkeypatch.setattr(random_helpers.math, 'gcd', fail_gcd)
+
+    result = random_helpers.random_rolling_circle_radius(
+        fixed_radius=301,
+        prev=None,
+        constraint=RandomConstraintMode.WILD,
+        evolution=RandomEvolutionMode.RANDOM,
+    )
+
+    assert result == random_helpers.MAX_LAPS_TO_CLOSE
+
+
+def test_random_rolling_circle_radius_rejects_candidates_with_too_many_laps(monkeypatch: pytest.MonkeyPatch) -> None:
+    candidates = iter((899, 600))
+    monkeypatch.setattr(random_helpers.random, 'randint', lambda _lower, _upper: next(candidates))
+
+    result = random_helpers.random_rolling_circle_radius(
+        fixed_radius=300,
+        prev=None,
+        constraint=RandomConstraintMode.WILD,
+        evolution=RandomEvolutionMode.RANDOM,
+    )
+
+    assert result == 600
@@ -0,0 +1,15 @@
+import pytest
+
+from spirograph.console_ui.session import ConsoleUiSessionState
+
+
+@pytest.mark.parametrize(
+    ('field_name', 'message'),
+    (
+        ('laps_per_color', 'laps_per_color must be >= 1'),
+        ('spins_per_color', 'spins_per_color must be >= 1'),
+    ),
+)
+def test_session_rejects_color_intervals_below_one(field_name: str, message: str) -> None:
+    with pytest.raises(ValueError, match=message):
+        ConsoleUiSessionState(**{field_name: 0})
@@ -2,7 +2,7 @@ import math
 import pytest
 from types import SimpleNamespace
 
-from spirograph.generation.circular_generator import CircularSpiroGenerator
+from spirograph.generation.circular_generator import CircularSpiroGenerator, symmetric_arc_count
 from spirograph.generation.requests import CircularSpiroRequest
 from spirograph.generation.types import PointSpan, SpanKind, SpiroType
 
@@ -17,7 +17,8 @@ def test_generate_returns_steps_plus_one_points() -> None:
 
     curve = CircularSpiroGenerator().generate(request)
 
-    assert len(curve.points) == 121
+    assert len(curve.xs) == 121
+    assert len(curve.ys) == 121
 
 
 def test_generate_sets_expected_laps_to_close_metadata() -> None:
@@ -147,8 +148,8 @@ def test_lap_and_spin_spans_partition_all_points(curve_type: SpiroType) -> None:
     lap_spans = [span for span in curve.spans if span.kind is SpanKind.LAP]
     spin_spans = [span for span in curve.spans if span.kind is SpanKind.SPIN]
 
-    _assert_spans_partition_points(lap_spans, len(curve.points))
-    _assert_spans_partition_points(spin_spans, len(curve.points))
+    _assert_spans_partition_points(lap_spans, curve.point_count)
+    _assert_spans_partition_points(spin_spans, curve.point_count)
 
 
 @pytest.mark.parametrize(
@@ -180,3 +181,114 @@ def test_laps_to_close_uses_integer_gcd_semantics(
         int(fixed_radius),
         int(rolling_radius),
     )
+
+
+@pytest.mark.parametrize('curve_type', (SpiroType.HYPOTROCHOID, SpiroType.EPITROCHOID))
+@pytest.mark.parametrize('steps', (240, 241))
+def test_generate_matches_point_recurrence(curve_type: SpiroType, steps: int) -> None:
+    request = CircularSpiroRequest(
+        fixed_radius=120,
+        rolling_radius=45,
+        pen_distance=20,
+        steps=steps,
+        curve_type=curve_type,
+    )
+
+    coordinates = tuple(CircularSpiroGenerator._iter_coordinates(request))
+    curve = CircularSpiroGenerator().generate(request)
+
+    assert curve.point_count == len(coordinates)
+    assert list(curve.xs) == pytest.approx([x for x, _y in coordinates], abs=1e-9)
+    assert list(curve.ys) == pytest.approx([y for _x, y in coordinates], abs=1e-9)
+
+
+def test_request_caches_gcd_and_laps_to_close() -> None:
+    request = CircularSpiroRequest(
+        fixed_radius=120,
+        rolling_radius=45,
+        pen_distance=20,
+        steps=240,
+    )
+
+    assert request.gcd_value == 15
+    assert request.laps_to_close == 3
+    assert request.spins_to_close == 5
+    assert CircularSpiroRequest(120, 45, 20, 240, SpiroType.EPITROCHOID).spins_to_close == 11
+    assert request == CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=240)
+
+
+@pytest.mark.parametrize('curve_type', (SpiroType.HYPOTROCHOID, SpiroType.EPITROCHOID))
+@pytest.mark.parametrize('steps', (20000, 20001))
+def test_generated_points_match_closed_form_within_tolerance(curve_type: SpiroType, steps: int) -> None:
+    # 20000 steps split into 20 rotated arcs; 20001 does not, so the recurrence and its
+    # reseeds run over the whole curve.
+    request = CircularSpiroRequest(
+        fixed_radius=200,
+        rolling_radius=70,
+        pen_distance=50,
+        steps=steps,
+        curve_type=curve_type,
+    )
+
+    curve = CircularSpiroGenerator().generate(request)
+
+    period = math.tau * request.laps_to_close
+    sign = 1.0 if curve_type is SpiroType.HYPOTROCHOID else -1.0
+    center_radius = request.fixed_radius - sign * request.rolling_radius
+    ratio = center_radius / request.rolling_radius
+    for step in (0, 1, 1023, 1024, 1025, 2047, 2048, 2049, 9999, steps):
+        t = (step / request.steps) * period
+        assert curve.xs[step] == pytest.approx(
+            center_radius * math.cos(t) + sign * 50 * math.cos(ratio * t),
+            abs=1e-9,
+        )
+        assert curve.ys[step] == pytest.approx(center_radius * math.sin(t) - 50 * math.sin(ratio * t), abs=1e-9)
+
+
+def test_generate_reuses_cached_curve_for_equal_requests() -> None:
+    generator = CircularSpiroGenerator()
+    request = CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=240)
+
+    first = generator.generate(request)
+    second = generator.generate(
+        CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=240),
+    )
+    other = generator.generate(
+        CircularSpiroRequest(
+            fixed_radius=120,
+            rolling_radius=45,
+            pen_distance=20,
+            steps=240,
+            curve_type=SpiroType.EPITROCHOID,
+        ),
+    )
+
+    assert second is first
+    assert other is not first
+
+
+def test_generated_curve_is_read_only() -> None:
+    curve = CircularSpiroGenerator().generate(
+        CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=240)
+    )
+
+    with pytest.raises(TypeError):
+        curve.xs[0] = 1e6
+    with pytest.raises(TypeError):
+        curve.ys[0] = 1e6
+    with pytest.raises(TypeError):
+        curve.metadata['laps_to_close'] = 1
+
+
+@pytest.mark.parametrize(
+    ('fixed_radius', 'rolling_radius', 'gcd_value', 'expected'),
+    (
+        (200, 70, 10, 20),
+        (301, 299, 1, 301),
+        (200.0, 100.0, 100, 2),
+        (1.2, 0.5, 0, 1),
+        (2.9, 1.1, 1, 1),
+    ),
+)
+def test_symmetric_arc_count(fixed_radius: float, rolling_radius: float, gcd_value: int, expected: int) -> None:
+    assert symmetric_arc_count(fixed_radius, rolling_radius, gcd_value) == expected
@@ -0,0 +1,26 @@
+import pytest
+
+from spirograph.generation.circular_generator import CircularSpiroGenerator
+from spirograph.generation.requests import CircularSpiroRequest
+from spirograph.rendering.builder import RenderPlanBuilder
+from spirograph.rendering.types import ColorMode, RenderSettings
+
+
+@pytest.mark.parametrize('color_mode', (ColorMode.FIXED, ColorMode.RANDOM_PER_RUN, ColorMode.RANDOM_PER_LAP))
+def test_rendered_paths_cannot_change_cached_curve(color_mode: ColorMode) -> None:
+    generator = CircularSpiroGenerator()
+    request = CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=240)
+    curve = generator.generate(request)
+    expected_xs = list(curve.xs)
+    expected_ys = list(curve.ys)
+
+    plan = RenderPlanBuilder().build(curve, RenderSettings(color_mode=color_mode))
+    for path in plan.paths:
+        with pytest.raises(TypeError):
+            path.xs[0] = 1e6
+        with pytest.raises(TypeError):
+            path.ys[-1] = -1e6
+
+    cached = generator.generate(request)
+    assert list(cached.xs) == expected_xs
+    assert list(cached.ys) == expected_ys
@@ -0,0 +1,122 @@
+from array import array
+from collections.abc import Callable
+
+import pytest
+
+from spirograph.rendering import Color, DrawablePath, RenderPlan, RenderSettings, turtle_renderer
+from spirograph.rendering.turtle_renderer import to_canvas_coords
+
+
+def test_to_canvas_coords_interleaves_and_flips_y_axis() -> None:
+    xs = array('d', (1.5, -3.0))
+    ys = array('d', (2.0, -4.25))
+
+    assert to_canvas_coords(xs, ys) == [1.5, -2.0, -3.0, 4.25]
+
+
+def test_to_canvas_coords_applies_screen_scale() -> None:
+    assert to_canvas_coords(array('d', (1.0,)), array('d', (1.0,)), xscale=2.0, yscale=0.5) == [2.0, -0.5]
+
+
+class _FakeCanvas:
+    def __init__(self) -> None:
+        self.items: dict[int, list[float]] = {}
+        self.flush_count = 0
+
+    def create_line(self, coords: list[float], **_options: object) -> int:
+        assert len(coords) >= 4, 'Tk lines need at least two points'
+        item = len(self.items) + 1
+        self.items[item] = list(coords)
+        return item
+
+    def insert(self, item: int, index: str, coords: list[float]) -> None:
+        assert index == 'end'
+        self.items[item].extend(coords)
+
+    def delete(self, item: int) -> None:
+        del self.items[item]
+
+    def update_idletasks(self) -> None:
+        self.flush_count += 1
+
+
+class _FakeScreen:
+    xscale = 1.0
+    yscale = 1.0
+
+    def __init__(self) -> None:
+        self.canvas = _FakeCanvas()
+        self.update_count = 0
+
+    def update(self) -> None:
+        self.update_count += 1
+
+    def getcanvas(self) -> _FakeCanvas:
+        return self.canvas
+
+    def __getattr__(self, _name: str) -> Callable[..., None]:
+        return lambda *_args, **_kwargs: None
+
+
+def _build_line_plan() -> RenderPlan:
+    xs = array('d', (float(index) for index in range(11)))
+    ys = array('d', (float(2 * index) for index in range(11)))
+    return RenderPlan(paths=(DrawablePath(xs=xs, ys=ys, color=Color(255, 0, 0), width=1.0),))
+
+
+def _install_fake_screen(monkeypatch: pytest.MonkeyPatch) -> _FakeScreen:
+    screen = _FakeScreen()
+    monkeypatch.setattr(turtle_renderer.turtle, 'Screen', lambda: screen)
+    return screen
+
+
+@pytest.mark.parametrize('speed', (1, 3, 10))
+def test_canvas_render_draws_each_path_as_one_complete_line_item(monkeypatch: pytest.MonkeyPatch, speed: int) -> None:
+    screen = _install_fake_screen(monkeypatch)
+    plan = _build_line_plan()
+    renderer = turtle_renderer.TurtleGraphicsRenderer()
+
+    renderer.render(plan, RenderSettings(speed=speed))
+    renderer.render(plan, RenderSettings(speed=speed))
+
+    path = plan.paths[0]
+    assert list(screen.canvas.items.values()) == [to_canvas_coords(path.xs, path.ys)]
+
+
+def test_canvas_render_skips_single_point_paths(monkeypatch: pytest.MonkeyPatch) -> None:
+    screen = _install_fake_screen(monkeypatch)
+    plan = RenderPlan(
+        paths=(DrawablePath(xs=array('d', (1.0,)), ys=array('d', (2.0,)), color=Color(255, 0, 0), width=1.0),)
+    )
+
+    turtle_renderer.TurtleGraphicsRenderer().render(plan, RenderSettings(speed=3))
+
+    assert screen.canvas.items == {}
+
+
+def test_instant_speed_draws_without_intermediate_flushes(monkeypatch: pytest.MonkeyPatch) -> None:
+    screen = _install_fake_screen(monkeypatch)
+
+    turtle_renderer.TurtleGraphicsRenderer().render(
+        _build_line_plan(),
+        RenderSettings(speed=turtle_renderer.INSTANT_DRAW_SPEED),
+    )
+
+    assert screen.canvas.flush_count == 0
+
+
+def test_animated_render_periodically_processes_window_events(monkeypatch: pytest.MonkeyPatch) -> None:
+    screen = _install_fake_screen(monkeypatch)
+    renderer = turtle_renderer.TurtleGraphicsRenderer()
+    ticks = iter(range(100))
+    monkeypatch.setattr(
+        turtle_renderer.time,
+        'monotonic',
+        lambda: next(ticks) * turtle_renderer.EVENT_PUMP_INTERVAL_SECONDS / 4,
+    )
+
+    renderer.render(_build_line_plan(), RenderSettings(speed=1))
+
+    # Ten refreshes at a quarter interval each: two full updates mid-render plus the final one.
+    assert screen.update_count == 3
+    assert screen.canvas.flush_count == 8
@@ -0,0 +1,91 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import SimpleNamespace
+
+import pytest
+
+from spirograph import main
+from spirograph.console_ui.session import ConsoleUiSessionState
+from spirograph.generation.requests import CircularSpiroRequest
+
+
+class _FakeOrchestrator:
+    def __init__(self, interrupt_on_render: int | None = None) -> None:
+        self.rendered: list[CircularSpiroRequest] = []
+        self._interrupt_on_render = interrupt_on_render
+
+    def generate(self, request: CircularSpiroRequest) -> SimpleNamespace:
+        return SimpleNamespace(request=request)
+
+    def render(self, curve: SimpleNamespace, _settings: object) -> None:
+        if len(self.rendered) == self._interrupt_on_render:
+            raise KeyboardInterrupt
+        self.rendered.append(curve.request)
+
+
+class _RandomRequestStub:
+    def __init__(self) -> None:
+        self.requests: list[CircularSpiroRequest] = []
+        self.sessions: list[ConsoleUiSessionState] = []
+        self.last_requests: list[CircularSpiroRequest | None] = []
+
+    def __call__(self, session: ConsoleUiSessionState) -> CircularSpiroRequest:
+        steps = 100 + len(self.requests)
+        request = CircularSpiroRequest(fixed_radius=120, rolling_radius=45, pen_distance=20, steps=steps)
+        self.sessions.append(session)
+        self.last_requests.append(session.last_request)
+        self.requests.append(request)
+        return request
+
+
+class _RecordingExecutor(ThreadPoolExecutor):
+    futures: list[Future] = []
+
+    def submit(self, *args: object, **kwargs: object) -> Future:
+        future = super().submit(*args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+@pytest.fixture
+def random_requests(monkeypatch: pytest.MonkeyPatch) -> _RandomRequestStub:
+    stub = _RandomRequestStub()
+    monkeypatch.setattr(main, 'generate_random_request', stub)
+    monkeypatch.setattr(main.time, 'sleep', lambda _seconds: None)
+    monkeypatch.setattr(_RecordingExecutor, 'futures', [])
+    monkeypatch.setattr(main, 'ThreadPoolExecutor', _RecordingExecutor)
+    return stub
+
+
+def test_run_batch_renders_curves_in_order_and_skips_last_prefetch(random_requests: _RandomRequestStub) -> None:
+    orchestrator = _FakeOrchestrator()
+
+    main.run_batch(orchestrator, ConsoleUiSessionState(), count=4, pause_seconds=1.0)
+
+    assert orchestrator.rendered == random_requests.requests
+    assert len(random_requests.requests) == 4
+    assert len(_RecordingExecutor.futures) == 3
+
+
+def test_run_batch_prefetch_sees_presented_request_on_a_session_copy(random_requests: _RandomRequestStub) -> None:
+    session = ConsoleUiSessionState()
+
+    main.run_batch(_FakeOrchestrator(), session, count=3, pause_seconds=0.0)
+
+    assert random_requests.sessions[0] is session
+    for index in range(1, 3):
+        assert random_requests.sessions[index] is not session
+        assert random_requests.last_requests[index] is random_requests.requests[index - 1]
+    assert session.last_request is random_requests.requests[-1]
+
+
+def test_run_batch_interrupt_reports_progress_and_stops_prefetch(
+    random_requests: _RandomRequestStub, capsys: pytest.CaptureFixture[str]
+) -> None:
+    orchestrator = _FakeOrchestrator(interrupt_on_render=2)
+
+    main.run_batch(orchestrator, ConsoleUiSessionState(), count=5, pause_seconds=0.0)
+
+    assert 'Batch interrupted. Completed 2/5 curve(s).' in capsys.readouterr().out
+    assert orchestrator.rendered == random_requests.requests[:2]
+    assert len(_RecordingExecutor.futures) == 3
+    assert all(future.done() for future in _RecordingExecutor.futures)